@@ -1,3 +1,5 @@
+import argparse
+import hashlib
 import random
 import tkinter as tk
 
@@ -6,261 +8,29 @@ from PIL import Image, ImageTk
 
 import os
 
+from pokemon_model import BoardModel, POKEMON, FLAG, UNEXPOSED
+
 os.environ['TK_SILENCE_DEPRECATION'] = '1'
 
 
-UP = "up"
-DOWN = "down"
-LEFT = "left"
-RIGHT = "right"
-DIRECTIONS = (UP, DOWN, LEFT, RIGHT,
-              f"{UP}-{LEFT}", f"{UP}-{RIGHT}",
-              f"{DOWN}-{LEFT}", f"{DOWN}-{RIGHT}")
-POKEMON = "☺"
-FLAG = "@"
-UNEXPOSED = "~"
 TASK_ONE = "(1)"
 TASK_TWO = "(2)"
 NUMBERS = ('zero', 'one', 'two', 'three', 'four', 'five', 'six', 'seven', 'eight')
 POKEMONS = ('charizard', 'cyndaquil', 'pikachu', 'psyduck', 'togepi', 'umbreon')
-
-class BoardModel(object):
-    """
-    Model used to store and manage the internal game state.
-    """
-    def __init__(self, grid_size, num_pokemon):
-        """
-        Constructs the internal game state.
-
-        Parameters:
-            grid_size (int): Size of game.
-            num_pokemon (int): Number of hidden Pokemon.
-        """
-        self._grid_size = grid_size
-        self._num_pokemon = num_pokemon
-        self._pokemon_locations = ()
-        self.generate_pokemons() #Generate Pokemon locations
-        self._num_attempted_catches = 0
-        self._game = UNEXPOSED * grid_size ** 2
-
-    def get_game(self):
-        """
-        (str): Returns string representation of the current state of game board.
-        """
-        return self._game
-    
-    def get_pokemon_locations(self):
-        """
-        (tuple<int, ...>): Returns the indices describing all pokemon locations.
-        """
-        return self._pokemon_locations
-    
-    def get_num_attempted_catches(self):
-        """
-        (int): Returns the number of pokeballs currently placed on the board.
-        """
-        return self._num_attempted_catches
-    
-    def get_num_pokemon(self):
-        """
-        (int): Returns the number of pokemon hidden in the game (not caught).
-        """
-        return self._num_pokemon
-        
-    def check_win(self):
-        """
-        (bool): Returns True if the game has been won, else False.
-        """
-        return UNEXPOSED not in self._game and self._game.count(FLAG) == len(self._pokemon_locations)
-    
-    def check_loss(self):
-        """
-        (bool): Returns True if the game has been lost, else False.
-        """
-        return POKEMON in self._game
-
-    def index_to_position(self, index):
-        """
-        Converts the game string index to the row, column coordinate on the game grid.
-        
-        Parameters:
-            index (int): The index of the cell in the game string.
-            
-        Returns:
-            (tuple<int, int>): The row, column position of a cell.
-        """
-        return index // self._grid_size, index % self._grid_size
-
-    def position_to_index(self, position):
-        """
-        Converts the row, column coordinate on the game grid to the corresponding index
-        in the game string.
-
-        Parameters:
-            position(tuple<int, int>): The row, column position of a cell.
-            
-        Returns:
-            (int): The index of the cell in the game string.
-        """
-        row, col = position
-        return row * self._grid_size + col
-
-    def generate_pokemons(self):
-        """
-        Pokemons will be generated and assigned a random index within the game string.
-        """
-        self._pokemon_locations = ()
-        cell_count = self._grid_size ** 2
-
-        for _ in range(self._num_pokemon):
-            if len(self._pokemon_locations) >= cell_count:
-                break
-            index = random.randint(0, cell_count-1)
-
-            while index in self._pokemon_locations:
-                index = random.randint(0, cell_count-1)
-
-            self._pokemon_locations += (index,)
-
-
-    def _replace_character_at_index(self, index, character):
-        """
-        Updates the game string with a new character at a specified index.
-        
-        Parameters:
-            index (int): The index of the cell where the character is replaced.
-            character (str): The new character that will replace the old character.
-        """
-        self._game = self._game[:index] + character + self._game[index + 1:]
-
-    def flag_cell(self, index):
-        """
-        Toggle Flag on or off at the selected index and updates the game string.
-        Does nothing if the selected index is already revealed.
-
-        Parameters:
-            index (int): The index of the cell being flagged or unflagged.
-        """
-        if self._game[index] == FLAG:
-            self._replace_character_at_index(index, UNEXPOSED)
-            self._num_attempted_catches -= 1
-            self._num_pokemon += 1
-
-        elif self._game[index] == UNEXPOSED:
-            self._replace_character_at_index(index, FLAG)
-            self._num_attempted_catches += 1
-            self._num_pokemon -= 1
-
-    def _index_in_direction(self, index, direction):
-        """
-        Returns the index of a cell adjacent to the selected cell at a given direction.
-
-        Parameters:
-            index (int): Index of the selected cell.
-            direction (str): String specifying the direction.
-
-        Returns:
-            (int): Index of the adjacent cell.
-        """
-        row, col = self.index_to_position(index)
-        if RIGHT in direction:
-            col += 1
-        elif LEFT in direction:
-            col -= 1
-        if UP in direction:
-            row -= 1
-        elif DOWN in direction:
-            row += 1
-        if not (0 <= col < self._grid_size and 0 <= row < self._grid_size):
-            return None
-        return self.position_to_index((row, col))
-
-    def _neighbour_directions(self, index):
-        """
-        Seek out all the neighbouring cell indices of selected cell.
-
-        Parameters:
-            index (int): Index of a selected cell
-
-        Returns:
-            (list<int, ...>): List of all neighbouring cell indices.
-        """
-        neighbours = []
-        for direction in DIRECTIONS:
-            neighbour = self._index_in_direction(index, direction)
-            if neighbour is not None:
-                neighbours.append(neighbour)
-        return neighbours
-
-    def number_at_cell(self, index):
-        """
-        Calculates the number to be displayed at the specified index in the game.
-
-        Parameters:
-            index (int): Index of a selected cell.
-        """
-        if self._game[index] != UNEXPOSED:
-            return int(self._game[index])
-        return len(set(self._pokemon_locations) & set(self._neighbour_directions(index)))
-
-    def _big_fun_search(self, index):
-        """
-        When the cell being revealed has a zero value, all the neighbouring cells of this
-        cell is revealed. This is repeated until all neighbouring cells have a non-zero
-        value. This method calculates all the cells to be revealed in this situation.
-
-        Parameters:
-            index (int): Index of the cell being revealed
-
-        Returns:
-            (list<int, ...>): List of all the indices to be revealed.
-        """
-        queue = [index]
-        discovered = [index]
-        visible = []
-
-        if self._game[index] == FLAG:
-            return queue
-
-        number = self.number_at_cell(index)
-        if number != 0:
-            return queue
-
-        while queue:
-            node = queue.pop()
-            for neighbour in self._neighbour_directions(node):
-                if neighbour in discovered:
-                    continue
-
-                discovered.append(neighbour)
-                if self._game[neighbour] != FLAG:
-                    number = self.number_at_cell(neighbour)
-                    if number == 0:
-                        queue.append(neighbour)
-                visible.append(neighbour)
-        return visible
-
-    def reveal_cells(self, index):
-        """
-        Reveals all neighbouring cells at index and repeats for all cells that have a zero
-        value. Updates the game string.
-
-        Parameters:
-            index (int): Index of the cell being revealed
-        """
-        if index in self._pokemon_locations:
-            for location in self._pokemon_locations:
-                self._replace_character_at_index(location, POKEMON)
-        elif self._game[index] == FLAG:
-            pass
-        else:
-            number = self.number_at_cell(index)
-            self._replace_character_at_index(index, str(number))
-            clear = self._big_fun_search(index)
-            for i in clear:
-                if self._game[i] != FLAG:
-                    number = self.number_at_cell(i)
-                    self._replace_character_at_index(i, str(number))
+IMAGE_DIR = "images"
+ATLAS_DIR = os.path.join(IMAGE_DIR, "atlas")
+#Stores the sprites digest with the size and modification time of every source file
+ATLAS_MANIFEST = os.path.join(ATLAS_DIR, "manifest.txt")
+#Every image drawn on the board, in the order they are packed into a sprite atlas
+SPRITES = (("unrevealed", "pokeball") + tuple(f"{number}_adjacent" for number in NUMBERS)
+           + tuple("pokemon_sprites/" + pokemon for pokemon in POKEMONS))
+#Cell widths (in pixels) with atlases built by --build-atlases, e.g. a 600 pixel board
+#with grid sizes 10, 12, 15, 20 and 30
+ATLAS_CELL_WIDTHS = (60, 50, 40, 30, 20)
+#Hash of the sprite source files, computed once by sprites_digest()
+_sprites_digest = None
+#How often the timer label is refreshed, in milliseconds. Does not affect the measured time.
+TIMER_REFRESH_MS = 250
 
 class PokemonGame(object):
     """
@@ -375,15 +145,15 @@ class PokemonGame(object):
     def check_game_over(self):
         """
         Check if the game is over and allow player to play again if they wish to do so,
-        exit otherwise. Stop timer when the game is over.
+        exit otherwise. Stop timer when the game is over, before asking the player.
         """
         ans = 'hi'
         if self._board_model.check_win():
-            ans = messagebox.askyesno("Game Over", "You win! Would you like to play again?")
             self._status_bar.stop_time()
+            ans = messagebox.askyesno("Game Over", "You win! Would you like to play again?")
         if self._board_model.check_loss():
-            ans = messagebox.askyesno("Game Over", "You lose! Would you like to play again?")
             self._status_bar.stop_time()
+            ans = messagebox.askyesno("Game Over", "You lose! Would you like to play again?")
         if ans != 'hi':
             if ans:
                 self.new_game()
@@ -402,12 +172,22 @@ class PokemonGame(object):
         """
         return self._board_model.get_num_pokemon()
 
+    def get_clock(self):
+        """
+        (GameClock): Returns the clock of the current game.
+        """
+        return self._board_model.get_clock()
+
     def save_game(self):
         """
         Saves necessary game information into a Text file if the player wishes to do so.
+        The timer is paused while the file dialog is open.
         """
+        timer_running = self.get_clock().is_running()
+        self._status_bar.stop_time()
         save_content = [self._board_model.get_game(), self._board_model.get_pokemon_locations(),
-                        self.get_num_attempted_catches(), self.get_num_pokemon(), self._status_bar.get_time()]
+                        self.get_num_attempted_catches(), self.get_num_pokemon(),
+                        f"{self.get_clock().get_elapsed():.3f}"]
         if self._filename is None:
             filename = filedialog.asksaveasfilename(filetypes=[("Text file (please add .txt when saving)", "txt")])
             if filename:
@@ -417,14 +197,20 @@ class PokemonGame(object):
             #The items in save_content are converted to strings and joined together with '#' separators
             fd.write("#".join(map(str, save_content)))
             fd.close()
+        if timer_running:
+            self._status_bar.start_time()
 
     def load_game(self):
         """
-        Load a previously saved game.
+        Load a previously saved game. The timer is paused while the file dialog is open.
         """
+        timer_running = self.get_clock().is_running()
+        self._status_bar.stop_time()
         filename = filedialog.askopenfilename(filetypes=[("Text file", "txt")])
-        if filename:
-            self._status_bar.destroy()
+        if not filename:
+            if timer_running:
+                self._status_bar.start_time()
+        else:
             self._filename = filename
             fd = open(filename, 'r')
             string = fd.read()
@@ -433,15 +219,24 @@ class PokemonGame(object):
             try:
                 self._board_model._game = content[0]
                 #Conversion of a string to a tuple
-                self._board_model._pokemon_locations = tuple(map(int, content[1].strip()[1:-1].split(',')))
+                self._board_model.set_pokemon_locations(map(int, content[1].strip()[1:-1].split(',')))
                 self._board_model._num_attempted_catches = int(content[2])
                 self._board_model._num_pokemon = int(content[3])
-                saved_time = tuple(map(int, content[4].strip()[1:-1].split(',')))
-                self._status_bar = StatusBar(self._master, self, saved_time)
+                saved_time = content[4].strip()
+                if saved_time.startswith('('):
+                    #Older saves store the time as (minutes, seconds)
+                    minutes, seconds = map(int, saved_time[1:-1].split(','))
+                    self.get_clock().reset(minutes * 60 + seconds)
+                else:
+                    self.get_clock().reset(float(saved_time))
+                self._status_bar.destroy()
+                self._status_bar = StatusBar(self._master, self)
                 self._status_bar.pack(side=tk.BOTTOM, fill=tk.BOTH)
                 self.redraw()
             except Exception:
                 messagebox.showinfo("Cannot load file", "The file used is incorrect")
+                if timer_running:
+                    self._status_bar.start_time()
             
     
     def restart_game(self):
@@ -452,6 +247,7 @@ class PokemonGame(object):
         self._board_model._game = UNEXPOSED * self._grid_size ** 2
         self._board_model._num_pokemon = self._num_pokemon
         self._board_model._num_attempted_catches = 0
+        self.get_clock().reset()
         self._status_bar = StatusBar(self._master, self)
         self._status_bar.pack(side=tk.BOTTOM, fill=tk.BOTH)
         self.redraw()
@@ -470,11 +266,15 @@ class PokemonGame(object):
     def quit(self):
         """
         If the player wishes to quit the game, ask whther they are sure. Continues the game
-        or end it depending on their response.
+        or end it depending on their response. The timer is paused while asking.
         """
+        timer_running = self.get_clock().is_running()
+        self._status_bar.stop_time()
         ans = messagebox.askyesno("Quit game", "Are you sure?")
         if ans:
             self._master.destroy()
+        elif timer_running:
+            self._status_bar.start_time()
 
 class BoardView(tk.Canvas):
     """
@@ -500,9 +300,6 @@ class BoardView(tk.Canvas):
         self.reveal = reveal
         self.flag = flag
 
-        #PhotoImages are stored in a dictionary to provide reference to them
-        self._images = {}
-        
         #Bind left and right clicks on Canvas
         self.bind("<Button-1>", self._left_click)
         for i in range(2,4):
@@ -572,61 +369,221 @@ class ImageBoardView(BoardView):
                          game state
         """
         self.delete(tk.ALL)
+        atlas = SpriteAtlas.load(self._cell_width)
         for index, cell_type in enumerate(board):
             x = index % self._grid_size * self._cell_width + self._cell_width * 0.5
             y = index // self._grid_size * self._cell_width + self._cell_width * 0.5           
             if cell_type == UNEXPOSED:
-                photo_image = self._retrieve_image("unrevealed")
+                photo_image = atlas.get_image("unrevealed")
             elif cell_type.isdigit():
                 num = int(cell_type)
-                photo_image = self._retrieve_image(f"{NUMBERS[num]}_adjacent")
+                photo_image = atlas.get_image(f"{NUMBERS[num]}_adjacent")
             elif cell_type == POKEMON:
                 pokemon = random.choice(POKEMONS)
-                photo_image = self._retrieve_image("pokemon_sprites/" + pokemon)
+                photo_image = atlas.get_image("pokemon_sprites/" + pokemon)
             elif cell_type == FLAG:
-                photo_image = self._retrieve_image("pokeball")
+                photo_image = atlas.get_image("pokeball")
             self.create_image(x, y, image=photo_image)
 
-    def _retrieve_image(self, image_name):
+class SpriteAtlas(object):
+    """
+    All board sprites resized to one cell width and packed side by side into a single
+    sheet. Sheets are cached on disk so that a board can be drawn with a single file read
+    instead of opening and resizing every image.
+    """
+    #Atlases already loaded in memory, keyed by cell width
+    _loaded = {}
+
+    def __init__(self, cell_width, sheet):
         """
-        Retrieve the PhotoImage from self._images.
+        Constructs an atlas from an already packed sheet.
 
         Parameters:
-            image_name (str): The assigned name of the PhotoImage.
+            cell_width (int): Width and height of each sprite in pixels.
+            sheet (Image): Image containing every sprite in SPRITES, in order.
         """
-        if image_name not in self._images:
-            self._add_image(image_name)
-        return self._images[image_name]
+        self._cell_width = cell_width
+        self._sheet = sheet
+        #PhotoImages are stored in a dictionary to provide reference to them
+        self._images = {}
 
-    def _add_image(self, image_name):
+    @classmethod
+    def load(cls, cell_width):
         """
-        Add a PhotoImage to self._images by opening and resizing an image file.
+        Returns the atlas for a cell width. Atlases are normally built ahead of time with
+        --build-atlases; a missing one is built and cached here instead.
 
         Parameters:
-            image_name (str): The assigned name of the PhotoImage.
+            cell_width (int): Width and height of each sprite in pixels.
+
+        Returns:
+            (SpriteAtlas): The atlas for the cell width.
         """
-        image = Image.open("images/" + image_name + ".gif")
-        image = image.resize((self._cell_width, self._cell_width))
-        photo_image = ImageTk.PhotoImage(image)
-        self._images[image_name] = photo_image
-        
+        if cell_width not in cls._loaded:
+            try:
+                sheet = Image.open(atlas_path(cell_width))
+                sheet.load()
+            except OSError:
+                sheet = build_sprite_atlas(cell_width)
+            cls._loaded[cell_width] = cls(cell_width, sheet)
+        return cls._loaded[cell_width]
+
+    def get_image(self, image_name):
+        """
+        Retrieve the PhotoImage of a sprite, cropping it from the sheet the first time.
+
+        Parameters:
+            image_name (str): The name of the sprite, as listed in SPRITES.
+        """
+        if image_name not in self._images:
+            x = SPRITES.index(image_name) * self._cell_width
+            image = self._sheet.crop((x, 0, x + self._cell_width, self._cell_width))
+            self._images[image_name] = ImageTk.PhotoImage(image)
+        return self._images[image_name]
+
+def _sprite_file(image_name):
+    """
+    (str): Returns the path of the source image file of a sprite.
+    """
+    return os.path.join(IMAGE_DIR, image_name + ".gif")
+
+def _sprite_stats():
+    """
+    (list<str>): Returns the name, size and modification time of every sprite source file.
+    """
+    stats = []
+    for image_name in SPRITES:
+        stat = os.stat(_sprite_file(image_name))
+        stats.append(f"{image_name} {stat.st_size} {stat.st_mtime_ns}")
+    return stats
+
+def _write_manifest(digest, stats):
+    """
+    Saves the sprites digest and the source file stats it was computed from. Nothing is
+    saved if the atlas directory cannot be written to.
+
+    Parameters:
+        digest (str): Hash of the sprite source files.
+        stats (list<str>): Stats of the sprite source files, from _sprite_stats().
+    """
+    temp_path = f"{ATLAS_MANIFEST}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(ATLAS_DIR, exist_ok=True)
+        with open(temp_path, 'w') as fd:
+            fd.write("\n".join([digest] + stats) + "\n")
+        os.replace(temp_path, ATLAS_MANIFEST)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def sprites_digest():
+    """
+    (str): Returns a hash of the contents of every sprite source file. Any change to the
+           images produces a different digest, so stale atlases are never loaded. The
+           files are only read when their size or modification time differs from the
+           manifest, and at most once per run.
+    """
+    global _sprites_digest
+    if _sprites_digest is None:
+        stats = _sprite_stats()
+        try:
+            with open(ATLAS_MANIFEST) as fd:
+                lines = fd.read().splitlines()
+            if lines[1:] == stats:
+                _sprites_digest = lines[0]
+        except OSError:
+            pass
+
+    if _sprites_digest is None:
+        digest = hashlib.sha1()
+        for image_name in SPRITES:
+            digest.update(image_name.encode())
+            with open(_sprite_file(image_name), 'rb') as fd:
+                digest.update(fd.read())
+        _sprites_digest = digest.hexdigest()[:12]
+        _write_manifest(_sprites_digest, stats)
+    return _sprites_digest
+
+def atlas_path(cell_width):
+    """
+    Returns the path of the cached atlas for a cell width.
+
+    Parameters:
+        cell_width (int): Width and height of each sprite in pixels.
+
+    Returns:
+        (str): Path of the atlas file.
+    """
+    return os.path.join(ATLAS_DIR, f"atlas_{cell_width}_{sprites_digest()}.png")
+
+def _remove_stale_atlases():
+    """
+    Deletes cached atlases that were built from a different version of the sprites.
+    Temporary files of atlases still being written are left alone.
+    """
+    suffix = f"_{sprites_digest()}.png"
+    for filename in os.listdir(ATLAS_DIR):
+        if (filename.startswith("atlas_") and filename.endswith(".png")
+                and not filename.endswith(suffix)):
+            os.remove(os.path.join(ATLAS_DIR, filename))
+
+def build_sprite_atlas(cell_width):
+    """
+    Resizes every sprite to the cell width, packs them into a single sheet and saves it
+    to the atlas cache. The sheet is still returned if it cannot be saved.
+
+    Parameters:
+        cell_width (int): Width and height of each sprite in pixels.
+
+    Returns:
+        (Image): The packed sheet.
+    """
+    sheet = Image.new("RGBA", (cell_width * len(SPRITES), cell_width))
+    for i, image_name in enumerate(SPRITES):
+        image = Image.open(_sprite_file(image_name)).convert("RGBA")
+        #Nearest neighbour is what Pillow uses for the palette GIFs, so tiles keep their look
+        image = image.resize((cell_width, cell_width), Image.NEAREST)
+        sheet.paste(image, (i * cell_width, 0))
+
+    path = atlas_path(cell_width)
+    #Write to a temporary file first so an interrupted build never leaves a broken atlas
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(ATLAS_DIR, exist_ok=True)
+        sheet.save(temp_path, format="PNG")
+        os.replace(temp_path, path)
+        _remove_stale_atlases()
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return sheet
+
+def build_sprite_atlases(cell_widths=ATLAS_CELL_WIDTHS):
+    """
+    Builds any missing atlases for the given cell widths.
+
+    Parameters:
+        cell_widths (tuple<int, ...>): Cell widths to build atlases for.
+    """
+    for cell_width in cell_widths:
+        if not os.path.exists(atlas_path(cell_width)):
+            build_sprite_atlas(cell_width)
+
 class StatusBar(tk.Frame):
     """
     Sidebar display of the number of Pokeballs, timer and buttons to restart or play a new game.
     """
-    def __init__(self, master, parent, time=(0,0)):
+    def __init__(self, master, parent):
         """
-        Contructs the status bar of the game.
+        Contructs the status bar of the game and starts the game clock.
 
         Parameters:
             master (tk.Widget): Widget within which to place the status bar.
             parent (PokemonGame): The control class of the game.
-            time (tuple<int, int>): The starting time (minutes, seconds) for the timer.
         """
         super().__init__(master, bg="white", pady=5)
-        self._min, self._sec = time
         self._parent = parent
-        self._timer_on = True
+        self._after = None
 
         #Buttons Frame
         buttons_frame = tk.Frame(self, bg="white") 
@@ -671,24 +628,45 @@ class StatusBar(tk.Frame):
         """
         (tuple<int, int>): Returns the current time on the timer.
         """
-        return (self._min, self._sec)
-    
+        return divmod(int(self._parent.get_clock().get_elapsed()), 60)
+
     def start_time(self):
         """
-        Starts the timer.
+        Starts the game clock and keeps the timer label up to date.
+        """
+        if self._after is not None:
+            self.after_cancel(self._after)
+        self._parent.get_clock().start()
+        self._refresh_time()
+
+    def _refresh_time(self):
+        """
+        Shows the time measured by the game clock, and schedules the next refresh while
+        the clock is running.
         """
-        self._timer.config(text=f"{self._min}m {self._sec}s")
-        self._sec += 1
-        if self._sec == 60:
-            self._sec = 0
-            self._min += 1
-        self._after = self.after(1000, self.start_time)
+        minutes, seconds = self.get_time()
+        self._timer.config(text=f"{minutes}m {seconds}s")
+        if self._parent.get_clock().is_running():
+            self._after = self.after(TIMER_REFRESH_MS, self._refresh_time)
 
     def stop_time(self):
         """
         Stops the timer
         """
-        self._after = self.after_cancel(self._after)
+        self._parent.get_clock().pause()
+        if self._after is not None:
+            self.after_cancel(self._after)
+            self._after = None
+        self._refresh_time()
+
+    def destroy(self):
+        """
+        Cancels the pending timer refresh before destroying the status bar.
+        """
+        if self._after is not None:
+            self.after_cancel(self._after)
+            self._after = None
+        super().destroy()
 
     def update_attempts(self):
         """
@@ -705,8 +683,17 @@ class StatusBar(tk.Frame):
         
 def main():
     """
-    Creates the main window which the game is runned in.
+    Creates the main window which the game is runned in, or builds the sprite atlases
+    with --build-atlases.
     """
+    parser = argparse.ArgumentParser(description="Pokemon: Got 2 Find Them All!")
+    parser.add_argument("--build-atlases", action="store_true",
+                        help="build the sprite atlases for the common board sizes and exit")
+    args = parser.parse_args()
+    if args.build_atlases:
+        build_sprite_atlases()
+        return
+
     root = tk.Tk()
     PokemonGame(root)
     root.mainloop()
@@ -0,0 +1,303 @@
+import random
+import time
+
+
+POKEMON = "☺"
+FLAG = "@"
+UNEXPOSED = "~"
+
+class GameClock(object):
+    """
+    Measures the time spent playing a game. Time is taken from time.monotonic, so it does
+    not drift when the game is busy and is not affected by changes to the system clock.
+    """
+    def __init__(self, elapsed=0.0):
+        """
+        Constructs a paused clock.
+
+        Parameters:
+            elapsed (float): Seconds already spent on the game.
+        """
+        self._elapsed = elapsed
+        self._started = None
+
+    def is_running(self):
+        """
+        (bool): Returns True if the clock is running, else False.
+        """
+        return self._started is not None
+
+    def start(self):
+        """
+        Starts or resumes the clock. Does nothing if it is already running.
+        """
+        if self._started is None:
+            self._started = time.monotonic()
+
+    def pause(self):
+        """
+        Pauses the clock, keeping the time measured so far. Does nothing if it is already
+        paused.
+        """
+        if self._started is not None:
+            self._elapsed += time.monotonic() - self._started
+            self._started = None
+
+    def reset(self, elapsed=0.0):
+        """
+        Pauses the clock and sets the time measured so far.
+
+        Parameters:
+            elapsed (float): Seconds already spent on the game.
+        """
+        self._elapsed = elapsed
+        self._started = None
+
+    def get_elapsed(self):
+        """
+        (float): Returns the number of seconds the clock has been running for.
+        """
+        if self._started is None:
+            return self._elapsed
+        return self._elapsed + time.monotonic() - self._started
+
+class BoardModel(object):
+    """
+    Model used to store and manage the internal game state.
+    """
+    def __init__(self, grid_size, num_pokemon):
+        """
+        Constructs the internal game state.
+
+        Parameters:
+            grid_size (int): Size of game.
+            num_pokemon (int): Number of hidden Pokemon.
+        """
+        self._grid_size = grid_size
+        self._num_pokemon = num_pokemon
+        self._pokemon_locations = ()
+        self.generate_pokemons() #Generate Pokemon locations
+        self._num_attempted_catches = 0
+        self._game = UNEXPOSED * grid_size ** 2
+        self._clock = GameClock()
+
+    def get_game(self):
+        """
+        (str): Returns string representation of the current state of game board.
+        """
+        return self._game
+    
+    def get_clock(self):
+        """
+        (GameClock): Returns the clock measuring the time spent on this game.
+        """
+        return self._clock
+
+    def get_pokemon_locations(self):
+        """
+        (tuple<int, ...>): Returns the indices describing all pokemon locations.
+        """
+        return self._pokemon_locations
+    
+    def get_num_attempted_catches(self):
+        """
+        (int): Returns the number of pokeballs currently placed on the board.
+        """
+        return self._num_attempted_catches
+    
+    def get_num_pokemon(self):
+        """
+        (int): Returns the number of pokemon hidden in the game (not caught).
+        """
+        return self._num_pokemon
+        
+    def check_win(self):
+        """
+        (bool): Returns True if the game has been won, else False.
+        """
+        return UNEXPOSED not in self._game and self._game.count(FLAG) == len(self._pokemon_locations)
+    
+    def check_loss(self):
+        """
+        (bool): Returns True if the game has been lost, else False.
+        """
+        return POKEMON in self._game
+
+    def index_to_position(self, index):
+        """
+        Converts the game string index to the row, column coordinate on the game grid.
+        
+        Parameters:
+            index (int): The index of the cell in the game string.
+            
+        Returns:
+            (tuple<int, int>): The row, column position of a cell.
+        """
+        return index // self._grid_size, index % self._grid_size
+
+    def position_to_index(self, position):
+        """
+        Converts the row, column coordinate on the game grid to the corresponding index
+        in the game string.
+
+        Parameters:
+            position(tuple<int, int>): The row, column position of a cell.
+            
+        Returns:
+            (int): The index of the cell in the game string.
+        """
+        row, col = position
+        return row * self._grid_size + col
+
+    def generate_pokemons(self):
+        """
+        Pokemons will be generated and assigned a random index within the game string.
+        """
+        cell_count = self._grid_size ** 2
+        self.set_pokemon_locations(random.sample(range(cell_count),
+                                                 min(self._num_pokemon, cell_count)))
+
+    def set_pokemon_locations(self, locations):
+        """
+        Replaces the pokemon locations, and rebuilds the set of locations and the number of
+        adjacent pokemon of every cell used to reveal cells.
+
+        Parameters:
+            locations (iterable<int>): The indices of all pokemon locations.
+        """
+        self._pokemon_locations = tuple(locations)
+        self._location_set = set(self._pokemon_locations)
+        self._adjacent_counts = [0] * self._grid_size ** 2
+        for location in self._location_set:
+            for neighbour in self._neighbours(location):
+                self._adjacent_counts[neighbour] += 1
+
+    def _replace_character_at_index(self, index, character):
+        """
+        Updates the game string with a new character at a specified index.
+        
+        Parameters:
+            index (int): The index of the cell where the character is replaced.
+            character (str): The new character that will replace the old character.
+        """
+        self._game = self._game[:index] + character + self._game[index + 1:]
+
+    def _replace_characters(self, characters):
+        """
+        Updates the game string with new characters at several indices, rebuilding the
+        string only once.
+
+        Parameters:
+            characters (dict<int, str>): The new character for each index being replaced.
+        """
+        if len(characters) == 1:
+            (index, character), = characters.items()
+            self._replace_character_at_index(index, character)
+            return
+        game = list(self._game)
+        for index, character in characters.items():
+            game[index] = character
+        self._game = "".join(game)
+
+    def flag_cell(self, index):
+        """
+        Toggle Flag on or off at the selected index and updates the game string.
+        Does nothing if the selected index is already revealed.
+
+        Parameters:
+            index (int): The index of the cell being flagged or unflagged.
+        """
+        if self._game[index] == FLAG:
+            self._replace_character_at_index(index, UNEXPOSED)
+            self._num_attempted_catches -= 1
+            self._num_pokemon += 1
+
+        elif self._game[index] == UNEXPOSED:
+            self._replace_character_at_index(index, FLAG)
+            self._num_attempted_catches += 1
+            self._num_pokemon -= 1
+
+    def _neighbours(self, index):
+        """
+        Seek out all the neighbouring cell indices of selected cell.
+
+        Parameters:
+            index (int): Index of a selected cell
+
+        Returns:
+            (list<int, ...>): List of all neighbouring cell indices.
+        """
+        row, col = self.index_to_position(index)
+        neighbours = []
+        #Every cell in the 3x3 block around the selected cell that is on the board
+        for neighbour_row in range(max(row - 1, 0), min(row + 2, self._grid_size)):
+            for neighbour_col in range(max(col - 1, 0), min(col + 2, self._grid_size)):
+                if (neighbour_row, neighbour_col) != (row, col):
+                    neighbours.append(neighbour_row * self._grid_size + neighbour_col)
+        return neighbours
+
+    def number_at_cell(self, index):
+        """
+        Calculates the number to be displayed at the specified index in the game.
+
+        Parameters:
+            index (int): Index of a selected cell.
+        """
+        if self._game[index] != UNEXPOSED:
+            return int(self._game[index])
+        return self._adjacent_counts[index]
+
+    def _big_fun_search(self, index):
+        """
+        When the cell being revealed has a zero value, all the neighbouring cells of this
+        cell is revealed. This is repeated until all neighbouring cells have a non-zero
+        value. This method calculates all the cells to be revealed in this situation.
+
+        Parameters:
+            index (int): Index of the cell being revealed
+
+        Returns:
+            (list<int, ...>): List of all the indices to be revealed.
+        """
+        queue = [index]
+        discovered = {index}
+        visible = []
+
+        if self._game[index] == FLAG:
+            return queue
+
+        number = self.number_at_cell(index)
+        if number != 0:
+            return queue
+
+        while queue:
+            node = queue.pop()
+            for neighbour in self._neighbours(node):
+                if neighbour in discovered:
+                    continue
+
+                discovered.add(neighbour)
+                if self._game[neighbour] != FLAG:
+                    number = self.number_at_cell(neighbour)
+                    if number == 0:
+                        queue.append(neighbour)
+                visible.append(neighbour)
+        return visible
+
+    def reveal_cells(self, index):
+        """
+        Reveals all neighbouring cells at index and repeats for all cells that have a zero
+        value. Updates the game string.
+
+        Parameters:
+            index (int): Index of the cell being revealed
+        """
+        if index in self._location_set:
+            self._replace_characters({location: POKEMON for location in self._pokemon_locations})
+        elif self._game[index] != UNEXPOSED:
+            #Flagged cells cannot be revealed, and revealed cells are already up to date
+            pass
+        else:
+            clear = [index] + self._big_fun_search(index)
+            self._replace_characters({i: str(self.number_at_cell(i))
+                                      for i in clear if self._game[i] != FLAG})
@@ -0,0 +1,402 @@
+import argparse
+import curses
+import locale
+import random
+import shutil
+import sys
+
+from pokemon_model import BoardModel
+
+REVEAL = "reveal"
+FLAG_CELL = "flag"
+#Each cell is drawn as its symbol followed by a space
+CELL_WIDTH = 2
+#Lines below the board used for the status and messages
+STATUS_LINES = 2
+MOVE_KEYS = {curses.KEY_UP: (-1, 0), ord('k'): (-1, 0),
+             curses.KEY_DOWN: (1, 0), ord('j'): (1, 0),
+             curses.KEY_LEFT: (0, -1), ord('h'): (0, -1),
+             curses.KEY_RIGHT: (0, 1), ord('l'): (0, 1)}
+REVEAL_KEYS = (ord(' '), ord('\n'), curses.KEY_ENTER)
+HELP = "arrows/hjkl move  space reveal  f flag  n new game  q quit"
+
+class TerminalView(object):
+    """
+    View of the game board on a character terminal. Only the cells inside a scrolling
+    viewport are shown, and only cells that changed since the previous frame are redrawn.
+    """
+    def __init__(self, grid_size, rows, cols):
+        """
+        Constructs the terminal view of the game.
+
+        Parameters:
+            grid_size (int): Size of the game grid.
+            rows (int): Number of board rows that fit on the terminal.
+            cols (int): Number of board columns that fit on the terminal.
+        """
+        self._grid_size = grid_size
+        self._top = 0
+        self._left = 0
+        self.resize(rows, cols)
+
+    def resize(self, rows, cols):
+        """
+        Changes the size of the viewport. The whole viewport is redrawn on the next frame.
+
+        Parameters:
+            rows (int): Number of board rows that fit on the terminal.
+            cols (int): Number of board columns that fit on the terminal.
+        """
+        self._rows = max(1, min(rows, self._grid_size))
+        self._cols = max(1, min(cols, self._grid_size))
+        self._scroll_to(self._top, self._left)
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Forgets the previous frame, for when the terminal has been cleared.
+        """
+        #Maps (screen row, screen column) to the symbol last drawn there
+        self._frame = {}
+
+    def get_viewport(self):
+        """
+        (tuple<int, int, int, int>): Returns the top row, left column, number of rows and
+                                     number of columns of the board that are visible.
+        """
+        return self._top, self._left, self._rows, self._cols
+
+    def _scroll_to(self, top, left):
+        """
+        Moves the top left corner of the viewport, keeping it within the board.
+
+        Parameters:
+            top (int): Board row shown at the top of the viewport.
+            left (int): Board column shown at the left of the viewport.
+        """
+        self._top = max(0, min(top, self._grid_size - self._rows))
+        self._left = max(0, min(left, self._grid_size - self._cols))
+
+    def scroll_to_show(self, position):
+        """
+        Scrolls the viewport as little as possible so that a cell is visible.
+
+        Parameters:
+            position (tuple<int, int>): The row, column coordinate of the cell.
+        """
+        row, col = position
+        top, left = self._top, self._left
+        if row < top:
+            top = row
+        elif row >= top + self._rows:
+            top = row - self._rows + 1
+        if col < left:
+            left = col
+        elif col >= left + self._cols:
+            left = col - self._cols + 1
+        self._scroll_to(top, left)
+
+    def position_to_screen(self, position):
+        """
+        Converts a board position to the terminal row and column it is drawn at.
+
+        Parameters:
+            position (tuple<int, int>): The row, column coordinate of a visible cell.
+
+        Returns:
+            (tuple<int, int>): The terminal row, column of the cell.
+        """
+        row, col = position
+        return row - self._top, (col - self._left) * CELL_WIDTH
+
+    def changed_cells(self, board):
+        """
+        Compares the visible part of the board with the previous frame.
+
+        Parameters:
+            board (str): The game string from BoardModel.
+
+        Returns:
+            (list<tuple<int, int, str>>): The viewport row, viewport column and symbol of
+                                          every cell that has to be redrawn.
+        """
+        changes = []
+        for screen_row in range(self._rows):
+            start = (self._top + screen_row) * self._grid_size + self._left
+            for screen_col, cell_type in enumerate(board[start:start + self._cols]):
+                if self._frame.get((screen_row, screen_col)) != cell_type:
+                    self._frame[(screen_row, screen_col)] = cell_type
+                    changes.append((screen_row, screen_col, cell_type))
+        return changes
+
+    def render_ansi(self, board):
+        """
+        Builds the ANSI escape sequences that bring the terminal up to date with the board.
+        Adjacent changed cells on the same row share a single cursor movement.
+
+        Parameters:
+            board (str): The game string from BoardModel.
+
+        Returns:
+            (str): Text to write to the terminal, empty if nothing changed.
+        """
+        output = []
+        previous = None
+        for screen_row, screen_col, cell_type in self.changed_cells(board):
+            if previous != (screen_row, screen_col - 1):
+                output.append(f"\x1b[{screen_row + 1};{screen_col * CELL_WIDTH + 1}H")
+            output.append(cell_type + " ")
+            previous = (screen_row, screen_col)
+        return "".join(output)
+
+class TerminalGame(object):
+    """
+    Control class for playing the game interactively in a curses window.
+    """
+    def __init__(self, screen, grid_size=10, num_pokemon=15):
+        """
+        Constructs the game within a curses window.
+
+        Parameters:
+            screen (curses.window): Window the game is drawn in.
+            grid_size (int): Size of the game grid.
+            num_pokemon (int): Number of Pokemons to be hidden.
+        """
+        self._screen = screen
+        self._grid_size = grid_size
+        self._num_pokemon = num_pokemon
+        self._board_model = BoardModel(grid_size, num_pokemon)
+        self._cursor = (0, 0)
+        self._message = HELP
+        self._game_over = False
+        self._view = TerminalView(grid_size, *self._viewport_size())
+
+    def _viewport_size(self):
+        """
+        (tuple<int, int>): Returns the number of board rows and columns that fit in the
+                           window.
+        """
+        height, width = self._screen.getmaxyx()
+        #The last column is left empty, as curses cannot write to the bottom right corner
+        return height - STATUS_LINES, (width - 1) // CELL_WIDTH
+
+    def run(self):
+        """
+        Handles key presses until the player quits.
+        """
+        curses.curs_set(1)
+        self._screen.keypad(True)
+        self._screen.clear()
+        while True:
+            self.draw()
+            key = self._screen.getch()
+            if key == ord('q'):
+                break
+            elif key == curses.KEY_RESIZE:
+                self._screen.clear()
+                self._view.resize(*self._viewport_size())
+            elif key == ord('n'):
+                self.new_game()
+            elif key in MOVE_KEYS and not self._game_over:
+                self.move_cursor(*MOVE_KEYS[key])
+            elif key in REVEAL_KEYS and not self._game_over:
+                self.reveal()
+            elif key == ord('f') and not self._game_over:
+                self.flag()
+
+    def draw(self):
+        """
+        Draws the cells that changed since the last frame, then the status lines. Only a
+        warning is drawn if the window cannot fit a board row and the status lines.
+        """
+        height, width = self._screen.getmaxyx()
+        if height < STATUS_LINES + 1 or width < CELL_WIDTH + 1:
+            self._screen.erase()
+            self._screen.addstr(0, 0, "Terminal too small"[:width - 1])
+            self._view.invalidate()
+            self._screen.refresh()
+            return
+
+        for screen_row, screen_col, cell_type in self._view.changed_cells(self._board_model.get_game()):
+            self._screen.addstr(screen_row, screen_col * CELL_WIDTH, cell_type)
+
+        _, _, rows, _ = self._view.get_viewport()
+        status = (f"{self._board_model.get_num_attempted_catches()} attempted catches  "
+                  f"{self._board_model.get_num_pokemon()} pokeballs left")
+        for line, text in enumerate((status, self._message)):
+            self._screen.move(rows + line, 0)
+            self._screen.clrtoeol()
+            self._screen.addstr(rows + line, 0, text[:width - 1])
+
+        self._screen.move(*self._view.position_to_screen(self._cursor))
+        self._screen.refresh()
+
+    def move_cursor(self, row_step, col_step):
+        """
+        Moves the cursor by one cell, scrolling the viewport if needed.
+
+        Parameters:
+            row_step (int): Change in the cursor row.
+            col_step (int): Change in the cursor column.
+        """
+        row, col = self._cursor
+        row = max(0, min(row + row_step, self._grid_size - 1))
+        col = max(0, min(col + col_step, self._grid_size - 1))
+        self._cursor = (row, col)
+        self._view.scroll_to_show(self._cursor)
+
+    def reveal(self):
+        """
+        Reveal cell or cells at the cursor.
+        """
+        index = self._board_model.position_to_index(self._cursor)
+        self._board_model.reveal_cells(index)
+        self.check_game_over()
+
+    def flag(self):
+        """
+        Flag or unflag the cell at the cursor.
+        """
+        index = self._board_model.position_to_index(self._cursor)
+        self._board_model.flag_cell(index)
+        if self._board_model.get_num_pokemon() < 0:
+            self._board_model.flag_cell(index)
+            self._message = "You got no more pokeballs!"
+        else:
+            self.check_game_over()
+
+    def check_game_over(self):
+        """
+        Check if the game is over and tell the player how to continue.
+        """
+        if self._board_model.check_win():
+            self._message = "You win! Press n for a new game or q to quit."
+            self._game_over = True
+        elif self._board_model.check_loss():
+            self._message = "You lose! Press n for a new game or q to quit."
+            self._game_over = True
+        else:
+            self._message = HELP
+
+    def new_game(self):
+        """
+        Restarts to a new game.
+        """
+        self._board_model = BoardModel(self._grid_size, self._num_pokemon)
+        self._message = HELP
+        self._game_over = False
+
+def parse_move(line):
+    """
+    Parses a move of the form "reveal ROW COL" or "flag ROW COL".
+
+    Parameters:
+        line (str): A line of a move script.
+
+    Returns:
+        (tuple<str, tuple<int, int>>): The action and the row, column position, or None
+                                       for blank and comment lines.
+    """
+    line = line.split('#', 1)[0].strip()
+    if not line:
+        return None
+    parts = line.split()
+    if len(parts) != 3 or parts[0] not in (REVEAL, FLAG_CELL):
+        raise ValueError(f"expected '{REVEAL} ROW COL' or '{FLAG_CELL} ROW COL'")
+    return parts[0], (int(parts[1]), int(parts[2]))
+
+def run_script(moves, grid_size, num_pokemon, out=sys.stdout, view=None):
+    """
+    Plays a game without user interaction, applying moves until they run out or the
+    game is over, then writes the final board and result.
+
+    Parameters:
+        moves (iterable<str>): Lines of a move script.
+        grid_size (int): Size of the game grid.
+        num_pokemon (int): Number of Pokemons to be hidden.
+        out (file): Where the board and result are written.
+        view (TerminalView): If given, the ANSI changes are written after every move.
+
+    Returns:
+        (int): Exit status, 0 on success and 2 if the script is invalid.
+    """
+    board_model = BoardModel(grid_size, num_pokemon)
+    if view is not None:
+        out.write("\x1b[2J" + view.render_ansi(board_model.get_game()))
+
+    num_moves = 0
+    for line_number, line in enumerate(moves, start=1):
+        if board_model.check_win() or board_model.check_loss():
+            break
+        try:
+            move = parse_move(line)
+        except ValueError as error:
+            sys.stderr.write(f"line {line_number}: {error}\n")
+            return 2
+        if move is None:
+            continue
+        action, (row, col) = move
+        if not (0 <= row < grid_size and 0 <= col < grid_size):
+            sys.stderr.write(f"line {line_number}: ({row}, {col}) is outside the board\n")
+            return 2
+
+        index = board_model.position_to_index((row, col))
+        if action == REVEAL:
+            board_model.reveal_cells(index)
+        else:
+            board_model.flag_cell(index)
+            if board_model.get_num_pokemon() < 0:
+                board_model.flag_cell(index)
+        num_moves += 1
+        if view is not None:
+            view.scroll_to_show((row, col))
+            out.write(view.render_ansi(board_model.get_game()))
+
+    if view is not None:
+        out.write(f"\x1b[{view.get_viewport()[2] + 1};1H")
+    game = board_model.get_game()
+    for row in range(grid_size):
+        out.write(" ".join(game[row * grid_size:(row + 1) * grid_size]) + "\n")
+    if board_model.check_win():
+        result = "win"
+    elif board_model.check_loss():
+        result = "loss"
+    else:
+        result = "in progress"
+    out.write(f"{result} after {num_moves} moves\n")
+    return 0
+
+def main():
+    """
+    Runs the game in the terminal, interactively or from a move script on stdin.
+    """
+    parser = argparse.ArgumentParser(description="Pokemon: Got 2 Find Them All! in the terminal.")
+    parser.add_argument("--grid-size", type=int, default=10, help="size of the game grid")
+    parser.add_argument("--num-pokemon", type=int, default=15, help="number of hidden Pokemon")
+    parser.add_argument("--seed", type=int, help="seed for the Pokemon locations")
+    parser.add_argument("--script", action="store_true",
+                        help="read 'reveal ROW COL' and 'flag ROW COL' moves from stdin")
+    parser.add_argument("--frames", action="store_true",
+                        help="with --script, also write the ANSI screen updates for each move")
+    args = parser.parse_args()
+
+    if args.grid_size < 1:
+        parser.error("grid size must be at least 1")
+    if args.num_pokemon not in range(args.grid_size ** 2 + 1):
+        parser.error("Too many pokemons")
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    if args.script:
+        view = None
+        if args.frames:
+            width, height = shutil.get_terminal_size()
+            view = TerminalView(args.grid_size, height - STATUS_LINES, (width - 1) // CELL_WIDTH)
+        sys.exit(run_script(sys.stdin, args.grid_size, args.num_pokemon, view=view))
+
+    #Lets curses draw the Pokemon symbol
+    locale.setlocale(locale.LC_ALL, '')
+    curses.wrapper(lambda screen: TerminalGame(screen, args.grid_size, args.num_pokemon).run())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import unittest
+
+from pokemon_model import BoardModel, POKEMON, FLAG, UNEXPOSED
+
+
+def make_board(grid_size, locations):
+    """
+    Returns a BoardModel with the pokemon at the given indices.
+
+    Parameters:
+        grid_size (int): Size of game.
+        locations (tuple<int, ...>): Indices of the pokemon.
+    """
+    board_model = BoardModel(grid_size, len(locations))
+    board_model.set_pokemon_locations(locations)
+    return board_model
+
+class BoardModelTest(unittest.TestCase):
+    """
+    Tests for revealing and flagging cells in BoardModel.
+    """
+    def test_generate_pokemons(self):
+        board_model = BoardModel(5, 10)
+        locations = board_model.get_pokemon_locations()
+        self.assertEqual(len(locations), 10)
+        self.assertEqual(len(set(locations)), 10)
+        self.assertTrue(all(0 <= index < 25 for index in locations))
+
+    def test_generate_pokemons_capped_at_cell_count(self):
+        self.assertEqual(len(BoardModel(2, 10).get_pokemon_locations()), 4)
+
+    def test_number_at_cell(self):
+        board_model = make_board(3, (0, 2))
+        self.assertEqual(board_model.number_at_cell(1), 2)
+        self.assertEqual(board_model.number_at_cell(4), 2)
+        self.assertEqual(board_model.number_at_cell(3), 1)
+        self.assertEqual(board_model.number_at_cell(6), 0)
+
+    def test_set_pokemon_locations_updates_numbers(self):
+        board_model = make_board(3, (0,))
+        self.assertEqual(board_model.number_at_cell(8), 0)
+        board_model.set_pokemon_locations([7])
+        self.assertEqual(board_model.get_pokemon_locations(), (7,))
+        self.assertEqual(board_model.number_at_cell(8), 1)
+        self.assertEqual(board_model.number_at_cell(0), 0)
+
+    def test_reveal_number(self):
+        board_model = make_board(4, (0,))
+        board_model.reveal_cells(1)
+        self.assertEqual(board_model.get_game(), UNEXPOSED + "1" + UNEXPOSED * 14)
+
+    def test_reveal_zero_floods_to_numbers(self):
+        board_model = make_board(4, (0,))
+        board_model.reveal_cells(15)
+        self.assertEqual(board_model.get_game(), UNEXPOSED + "100" "1100" "0000" "0000")
+        self.assertFalse(board_model.check_win())
+        self.assertFalse(board_model.check_loss())
+
+    def test_reveal_skips_flags(self):
+        board_model = make_board(4, (0,))
+        board_model.flag_cell(10)
+        board_model.reveal_cells(15)
+        self.assertEqual(board_model.get_game()[10], FLAG)
+        self.assertEqual(board_model.get_game()[5], "1")
+        board_model.reveal_cells(10)
+        self.assertEqual(board_model.get_game()[10], FLAG)
+
+    def test_reveal_revealed_cell_does_nothing(self):
+        board_model = make_board(4, (0,))
+        board_model.flag_cell(10)
+        board_model.reveal_cells(15)
+        board_model.flag_cell(10)
+        board_model.reveal_cells(15)
+        self.assertEqual(board_model.get_game()[10], UNEXPOSED)
+
+    def test_reveal_pokemon_loses(self):
+        board_model = make_board(4, (0, 5))
+        board_model.reveal_cells(5)
+        game = board_model.get_game()
+        self.assertEqual(game[0], POKEMON)
+        self.assertEqual(game[5], POKEMON)
+        self.assertEqual(game.count(POKEMON), 2)
+        self.assertTrue(board_model.check_loss())
+
+    def test_flag_and_reveal_wins(self):
+        board_model = make_board(4, (0,))
+        board_model.flag_cell(0)
+        self.assertEqual(board_model.get_num_attempted_catches(), 1)
+        self.assertEqual(board_model.get_num_pokemon(), 0)
+        board_model.reveal_cells(15)
+        self.assertTrue(board_model.check_win())
+
+    def test_unflag(self):
+        board_model = make_board(4, (0,))
+        board_model.flag_cell(3)
+        board_model.flag_cell(3)
+        self.assertEqual(board_model.get_game()[3], UNEXPOSED)
+        self.assertEqual(board_model.get_num_attempted_catches(), 0)
+        self.assertEqual(board_model.get_num_pokemon(), 1)
+
+    def test_reveal_large_board(self):
+        board_model = make_board(300, (300 ** 2 - 1,))
+        board_model.reveal_cells(0)
+        self.assertEqual(board_model.get_game().count(UNEXPOSED), 1)
+
+if __name__ == "__main__":
+    unittest.main()